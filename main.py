@@ -1,24 +1,35 @@
-import time
 from datetime import datetime
-from typing import Optional
 import os
+import sys
 import json
+import csv
 import re
-import pandas as pd
+from typing import Callable, Iterator, Optional
+from collections import ChainMap
+from contextlib import suppress
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 
 # constants
 DEBUG = True
 MIN_SUBMISSIONS_SANITY_CHECK = 486
 MAX_RETRIES = 3
 SHORT_SLEEP = 3
-LONG_SLEEP = 10
 DEFAULT_TIMEOUT = 20
+GECKODRIVER_PATH = "resources/geckodriver"
+PROFILE_DIR = "resources/ff_profile"
+N_PANELS = 2  # current and previous submissions
 SUBMISSIONS_URL = "https://www4.unfccc.int/sites/submissionsstaging/Pages/Home.aspx"
 RELEVANT_ENTITY_TYPES = [
     "IGO",
@@ -29,23 +40,88 @@ RELEVANT_ENTITY_TYPES = [
     "UN",
     "Observer State",
 ]
-HEADLESS = False
+HEADLESS = True
 LOG_PATH = (
     os.devnull
 )  # this will supress any log file, for an actuall log file replace it with its path
+# only the submission sections of the relevant entity types
+SUBMISSION_SECTIONS_SELECTOR = ", ".join(
+    f"div.container.submissionarea > div.submissionssection[entitytype='{entity_type}']"
+    for entity_type in RELEVANT_ENTITY_TYPES
+)
+# returns the issue metadata and submissions of every grid in the open panel, same schema as the json output
+# normalizes innerText like selenium's WebElement.text: trim whitespace other than nbsp, then nbsp to space
+NORMALIZE_TEXT_JS = """
+const normalizeText = (text) => text.replace(/^[^\\S\\u00a0]+|[^\\S\\u00a0]+$/g, "").replace(/\\u00a0/g, " ");
+"""
+PARSE_SUBMISSIONS_JS = NORMALIZE_TEXT_JS + """
+const sectionsSelector = arguments[0];
+const findText = (elem, selector) => {
+    const found = elem.querySelector(selector);
+    return found ? normalizeText(found.innerText) : null;
+};
+const grids = document.querySelectorAll("div.panel-collapse.collapse.in div.soby_gridcell");
+return Array.from(grids, (grid) => {
+    const subDict = {
+        issue: findText(grid, "div.submissioncallarea > div div.col-md-10.issue"),
+        deadline: findText(grid, "div.submissioncallarea > div div.col-md-7.deadline"),
+        title: findText(grid, "div.submissioncallarea > div div.col-md-10.cfstitle"),
+        mandate: findText(grid, "div.submissioncallarea > div div.col-md-10.mandate"),
+        submissions: {},
+    };
+    for (const section of grid.querySelectorAll(sectionsSelector)) {
+        const entityType = section.getAttribute("entitytype");
+        subDict.submissions[entityType] = Array.from(
+            section.querySelectorAll("div.row.tablefilerow"),
+            (submission) => ({
+                submission_name: findText(submission, "div.col-sm-4.filename"),
+                submission_entity: findText(submission, "div.col-sm-4.entity"),
+                submission_language: findText(submission, "div.col-sm-2.language"),
+                submission_date: findText(submission, "div.col-sm-2.submissiondate"),
+                fileref: submission.getAttribute("fileref"),
+            })
+        );
+    }
+    return subDict;
+});
+"""
+# text of every element matching an xpath, in a single webdriver round-trip
+TEXT_BY_XPATH_JS = NORMALIZE_TEXT_JS + """
+const found = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+return Array.from({length: found.snapshotLength}, (_, i) => normalizeText(found.snapshotItem(i).innerText));
+"""
+# number of documents shown in parentheses in the panel titles
+_PANEL_COUNT_RE = re.compile(r"\((\d+)\)")
 
 
 def deploy_firefox(
-    path_to_geckodriver: str or None = "resources/geckodriver",
+    path_to_geckodriver: str or None = GECKODRIVER_PATH,
     headless: bool = HEADLESS,
+    profile_dir: Optional[str] = None,
     **kwargs,
 ) -> webdriver.Firefox:
     """
-    launches a firefox browser instance
+    launches a firefox browser instance. If profile_dir is given, firefox runs on that profile so that cookies
+    and the http cache persist across runs; a profile can only be used by one browser at a time
     """
     firefox_ops = Options()
     if headless:
         firefox_ops.add_argument("-headless")
+    firefox_ops.add_argument("-no-remote")
+    # only text and attributes are scraped, skip images, webfonts and gpu compositing
+    firefox_ops.set_preference("permissions.default.image", 2)
+    firefox_ops.set_preference("gfx.downloadable_fonts.enabled", False)
+    firefox_ops.set_preference("browser.display.use_document_fonts", 0)
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+        firefox_ops.add_argument("-profile")
+        firefox_ops.add_argument(os.path.abspath(profile_dir))
+        firefox_ops.set_preference("browser.cache.disk.enable", True)
+        firefox_ops.set_preference("browser.cache.disk.capacity", 256000)
+    else:
+        firefox_ops.set_preference("browser.cache.disk.enable", False)
+    firefox_ops.set_preference("layers.acceleration.disabled", True)
+    firefox_ops.set_preference("javascript.options.mem.max", 256000)
     driver = webdriver.Firefox(
         executable_path=path_to_geckodriver,
         options=firefox_ops,
@@ -70,14 +146,14 @@ def minimum_of_submissions_sanity_check(
     After several repetitions the constant MIN_SUBMISSIONS_SANITY_CHECK was the correct value in 07/06/2022.
     If below this number, throw a False.
     """
-    panel_titles = driver.find_elements(
-        By.XPATH, "//div[@class = 'panel-group']//a[@class = 'collapsed']"
+    panel_titles = driver.execute_script(
+        TEXT_BY_XPATH_JS, "//div[@class = 'panel-group']//a[@class = 'collapsed']"
     )
     doc_count = 0
     for title in panel_titles:
-        n = re.search(r"(?<=\()[0-9]+(?=\))", title.text)
+        n = _PANEL_COUNT_RE.search(title)
         if n:
-            doc_count += int(n.group(0))
+            doc_count += int(n.group(1))
         else:
             return False
     return doc_count >= min_heuristic
@@ -85,60 +161,56 @@ def minimum_of_submissions_sanity_check(
 
 def _visit_main_page(driver: webdriver.Firefox) -> None:
     """
-    Visit the main page and open the submissions panels
+    Visit the main page and clear the tags. Raises TimeoutException if the panels do not add up to
+    MIN_SUBMISSIONS_SANITY_CHECK documents within DEFAULT_TIMEOUT
     """
     driver.get(SUBMISSIONS_URL)
-    time.sleep(SHORT_SLEEP)
     # clear tags
-    tags_btn = driver.find_element(By.ID, "btnClearTags")
-    tags_btn.click()
-    time.sleep(LONG_SLEEP)
-    WebDriverWait(driver, DEFAULT_TIMEOUT).until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//div[@class = 'panel-group']//a[@class = 'collapsed']")
-        )
+    tags_btn = WebDriverWait(driver, DEFAULT_TIMEOUT).until(
+        EC.element_to_be_clickable((By.ID, "btnClearTags"))
     )
+    tags_btn.click()
+    # the tags are cleared once the panel counts are no longer filtered
+    WebDriverWait(driver, DEFAULT_TIMEOUT).until(minimum_of_submissions_sanity_check)
 
 
 def visit_main_page(driver: webdriver.Firefox) -> None:
-    """Visit the main page and check if the number of documents displayed by the web-server passes doc count sanity check"""
-    _visit_main_page(driver)
-    # sanity check
-    i = 0
-    while not minimum_of_submissions_sanity_check(driver, MIN_SUBMISSIONS_SANITY_CHECK):
-        _visit_main_page(driver)
-        i += 1
-        if i > MAX_RETRIES:
-            raise ValueError(
-                "Web server is loading a very small number of documents, data is not trust worthy"
-            )
-        else:   
-            time.sleep(LONG_SLEEP)
-            
+    """Visit the main page, reloading it until the number of documents displayed by the web-server passes doc count sanity check"""
+    for _ in range(MAX_RETRIES + 1):
+        try:
+            _visit_main_page(driver)
+            return
+        except TimeoutException:
+            continue
+    raise ValueError(
+        "Web server is loading a very small number of documents, data is not trust worthy"
+    )
 
 
-def _open_submission_panel(
-    driver: webdriver.Firefox, panel_button: webdriver.remote.webelement.WebElement,
-    debug: bool = DEBUG
-) -> None:
+def find_panel_button(
+    driver: webdriver.Firefox, panel_index: int
+) -> webdriver.remote.webelement.WebElement:
+    """Find the button of the panel_index-th submissions panel"""
+    return driver.find_elements(
+        By.XPATH, "//div[@class = 'panel-group']//a[@class = 'collapsed']"
+    )[panel_index]
+
+
+def _open_submission_panel(driver: webdriver.Firefox, panel_index: int) -> None:
     """
     Open a submission panel. Note: both cannot be opened at the same time.
     """
-    i = 0
-    while True:
-        try:
-            panel_button.click()
-            break
-        except Exception as e:
-            if debug:
-                print(e)
-            if i > DEFAULT_TIMEOUT:
-                raise ValueError(
-                    f"Submission panel buttons are not clickable. Timed out at {DEFAULT_TIMEOUT} secs."
-                )
-            else:
-                time.sleep(SHORT_SLEEP)
-                i += 1
+    panel_button = find_panel_button(driver, panel_index)
+    try:
+        WebDriverWait(driver, DEFAULT_TIMEOUT).until(
+            EC.element_to_be_clickable(panel_button)
+        ).click()
+    except StaleElementReferenceException:
+        # the panels were re-rendered, look the button up again
+        panel_button = find_panel_button(driver, panel_index)
+        WebDriverWait(driver, DEFAULT_TIMEOUT).until(
+            EC.element_to_be_clickable(panel_button)
+        ).click()
     # wait for the panel to open
     WebDriverWait(driver, DEFAULT_TIMEOUT).until(
         EC.presence_of_element_located(
@@ -149,7 +221,7 @@ def _open_submission_panel(
 
 def open_submission_panel(
     driver: webdriver.Firefox,
-    panel_button: webdriver.remote.webelement.WebElement,
+    panel_index: int,
     max_attempts: int = MAX_RETRIES,
     debug: bool = DEBUG
 ) -> None:
@@ -158,7 +230,7 @@ def open_submission_panel(
     attempt = 0
     while True:
         try:
-            _open_submission_panel(driver, panel_button)
+            _open_submission_panel(driver, panel_index)
             WebDriverWait(driver, SHORT_SLEEP).until(
                 EC.presence_of_element_located(
                     (
@@ -173,7 +245,6 @@ def open_submission_panel(
                 print(e)
             if attempt < max_attempts:
                 visit_main_page(driver)
-                time.sleep(LONG_SLEEP)
                 attempt += 1
             else:
                 raise ValueError(
@@ -181,114 +252,150 @@ def open_submission_panel(
                 )
 
 
-def find_text_element(
-    elem: webdriver.remote.webelement.WebElement, xpath: str
-) -> Optional[str]:
+def _parse_submissions(driver: webdriver.Firefox) -> list:
     """
-    Error handling friendly find_element().text so that it returns a None object if webelement is missing
+    Parse the submission grids of the open panel. The DOM is walked in the browser by PARSE_SUBMISSIONS_JS
+    so that the whole page is collected in a single webdriver round-trip
     """
-    try:
-        return elem.find_element(
-            By.XPATH,
-            xpath,
-        ).text
-    except NoSuchElementException:
-        pass
+    # current_url is a webdriver round-trip, only fetch it once
+    base_url = driver.current_url.replace("/sites/submissionsstaging/Pages/Home.aspx", "")
+    submission_list = driver.execute_script(
+        PARSE_SUBMISSIONS_JS, SUBMISSION_SECTIONS_SELECTOR
+    )
+    for sub_dict in submission_list:
+        for submissions in sub_dict["submissions"].values():
+            for submission in submissions:
+                submission["submission_url"] = base_url + submission.pop("fileref")
+    return submission_list
 
 
-def _parse_submissions(driver: webdriver.Firefox) -> list:
-    """Parse a submission div element"""
-    submission_grids = driver.find_elements(
-        By.XPATH,
-        "//div[@class = 'panel-collapse collapse in']//div[@class = 'soby_gridcell ']",
-    )
-    submission_list = []
-    for submission_grid in submission_grids:
-        sub_dict = {}
-        sub_dict["issue"] = find_text_element(
-            submission_grid,
-            ".//div[@class = 'submissioncallarea']/div//div[@class = 'col-md-10 issue']",
-        )
-        sub_dict["deadline"] = find_text_element(
-            submission_grid,
-            ".//div[@class = 'submissioncallarea']/div//div[@class = 'col-md-7 deadline']",
-        )
-        sub_dict["title"] = find_text_element(
-            submission_grid,
-            ".//div[@class = 'submissioncallarea']/div//div[@class = 'col-md-10 cfstitle']",
+class BrowserPool:
+    """
+    Pool of firefox instances launched up front, in parallel, so that acquiring a browser does not pay for the
+    firefox/geckodriver cold start. Use it as a context manager so the browsers are always killed.
+    Each browser gets its own persistent profile under profile_dir, pass None for throwaway profiles.
+    """
+
+    def __init__(
+        self, size: int = N_PANELS, profile_dir: Optional[str] = PROFILE_DIR, **kwargs
+    ) -> None:
+        def _deploy(i: int) -> webdriver.Firefox:
+            browser_profile_dir = os.path.join(profile_dir, str(i)) if profile_dir else None
+            return deploy_firefox(profile_dir=browser_profile_dir, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(_deploy, i) for i in range(size)]
+        self._drivers = [f.result() for f in futures if f.exception() is None]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            # __exit__ never runs when construction fails, kill the browsers that did launch
+            self.close()
+            raise errors[0]
+        self._idle = queue.Queue()
+        for driver in self._drivers:
+            self._idle.put(driver)
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def acquire(self) -> webdriver.Firefox:
+        """Take an idle browser, blocks until one is released"""
+        return self._idle.get()
+
+    def release(self, driver: webdriver.Firefox) -> None:
+        """Reset the browser state and return it to the pool. Cookies are kept, they persist with the profile"""
+        driver.get("about:blank")
+        self._idle.put(driver)
+
+    def close(self) -> None:
+        """Kill all the browsers of the pool, including those whose session died"""
+        for driver in self._drivers:
+            try:
+                kill_webdriver(driver)
+            except WebDriverException:
+                # quit() still stops the geckodriver service of a dead session
+                with suppress(WebDriverException):
+                    driver.quit()
+
+
+def scrape_one_panel(pool: BrowserPool, panel_index: int) -> list:
+    """
+    Open a submissions panel on a browser from the pool and parse all of its pages. On failure the browser
+    is not returned to the pool, it may be dead and close() kills it anyway
+    """
+    driver = pool.acquire()
+    subs_container = _scrape_one_panel(driver, panel_index)
+    pool.release(driver)
+    return subs_container
+
+
+def _scrape_one_panel(driver: webdriver.Firefox, panel_index: int) -> list:
+    """Parse all the pages of the panel_index-th submissions panel"""
+    visit_main_page(driver)
+    # one worker per panel, a different layout would silently drop or miss panels
+    n_panels = len(
+        driver.find_elements(
+            By.XPATH, "//div[@class = 'panel-group']//a[@class = 'collapsed']"
         )
-        sub_dict["mandate"] = find_text_element(
-            submission_grid,
-            ".//div[@class = 'submissioncallarea']/div//div[@class = 'col-md-10 mandate']",
+    )
+    if n_panels != N_PANELS:
+        raise ValueError(
+            f"Expected {N_PANELS} submissions panels, the web page shows {n_panels}."
         )
-        submission_sections = submission_grid.find_elements(
+    open_submission_panel(driver, panel_index)
+    subs_container = []
+    while True:
+        subs_container.extend(_parse_submissions(driver))
+        first_grid = driver.find_element(
             By.XPATH,
-            ".//div[@class = 'container submissionarea']/div[@class = 'submissionssection']",
+            "//div[@class = 'panel-collapse collapse in']//div[@class = 'submissioncallarea']",
         )
-        sub_dict["submissions"] = {}
-        for submission_section in submission_sections:
-            entity_type = submission_section.get_attribute("entitytype")
-            if entity_type in RELEVANT_ENTITY_TYPES:
-                sub_dict["submissions"][entity_type] = []
-                submissions = submission_section.find_elements(
-                    By.XPATH, ".//div[contains(@class, 'row tablefilerow ')]"
-                )
-                if submissions:
-                    for submission in submissions:
-                        sub_url = driver.current_url.replace(
-                            "/sites/submissionsstaging/Pages/Home.aspx",
-                            submission.get_attribute("fileref"),
-                        )
-                        sub_dict["submissions"][entity_type].append(
-                            {
-                                "submission_name": find_text_element(
-                                    submission, ".//div[@class = 'col-sm-4 filename']"
-                                ),
-                                "submission_entity": find_text_element(
-                                    submission, ".//div[@class = 'col-sm-4 entity']"
-                                ),
-                                "submission_language": find_text_element(
-                                    submission, ".//div[@class = 'col-sm-2 language']"
-                                ),
-                                "submission_date": find_text_element(
-                                    submission,
-                                    ".//div[@class = 'col-sm-2 submissiondate']",
-                                ),
-                                "submission_url": sub_url,
-                            }
-                        )
-        submission_list.append(sub_dict)
-    return submission_list
+        try:
+            # next page
+            nxt = driver.find_element(
+                By.XPATH, "//a[contains(@onclick, '.GoToNextPage()')]"
+            )
+            nxt.click()
+        except:
+            break
+        # the previous page is gone from the DOM, then the grids of the next one stop coming in after the scroll
+        WebDriverWait(driver, DEFAULT_TIMEOUT).until(EC.staleness_of(first_grid))
+        driver.execute_script("window.scrollTo(0,document.body.scrollHeight)")
+        WebDriverWait(driver, DEFAULT_TIMEOUT).until(grid_count_settled())
+    return subs_container
 
 
-def parse_submissions(driver: webdriver.Firefox) -> dict:
+def grid_count_settled() -> Callable[[webdriver.Firefox], bool]:
     """
-    Wrapper around _parse_submissions for pagination
+    Expected condition: the open panel has submission grids and their number did not change since the previous poll
     """
-    # Open the current and previous submissions panels sequentially
-    panel_buttons = driver.find_elements(
-        By.XPATH, "//div[@class = 'panel-group']//a[@class = 'collapsed']"
-    )
-    subs_container = []
-    for panel_button in panel_buttons:
-        open_submission_panel(driver, panel_button)
-        while True:
-            subs_container.extend(_parse_submissions(driver))
-            try:
-                # next page
-                nxt = driver.find_element(
-                    By.XPATH, "//a[contains(@onclick, '.GoToNextPage()')]"
-                )
-                nxt.click()
-            except:
-                break
-            WebDriverWait(driver, DEFAULT_TIMEOUT).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//div[@class = 'submissioncallarea']")
-                )
+    last_count = None
+
+    def _predicate(driver: webdriver.Firefox) -> bool:
+        nonlocal last_count
+        count = len(
+            driver.find_elements(
+                By.XPATH,
+                "//div[@class = 'panel-collapse collapse in']//div[@class = 'soby_gridcell ']",
             )
-            driver.execute_script("window.scrollTo(0,document.body.scrollHeight)")
-            time.sleep(SHORT_SLEEP)
+        )
+        settled = count > 0 and count == last_count
+        last_count = count
+        return settled
+
+    return _predicate
+
+
+def parse_submissions(pool: BrowserPool) -> dict:
+    """
+    Scrape the current and previous submissions panels in parallel, one browser per panel
+    """
+    with ThreadPoolExecutor(max_workers=N_PANELS) as executor:
+        panels = executor.map(partial(scrape_one_panel, pool), range(N_PANELS))
+        subs_container = [submission for panel in panels for submission in panel]
     # add the query metadata and return
     return {
         "data_source": SUBMISSIONS_URL,
@@ -303,39 +410,67 @@ def write_to_json(submissions_data: list, data_dir: str = "data") -> None:
         json.dump(submissions_data, f, indent=4)
 
 
-def write_to_csv(submissions_data: list, data_dir: str = "data") -> None:
-    """write to data dir as csv"""
-    container = []
-    submissions_all = submissions_data.pop("submissions_data")
-    for issue in submissions_all:
+def flatten_submissions(submissions_data: dict) -> Iterator[ChainMap]:
+    """
+    Yield one flat row per submission. Rows are ChainMaps over the submission, its entity type and the issue
+    metadata, so no merged dict is allocated per row
+    """
+    collection_metadata = {
+        k: v for k, v in submissions_data.items() if k != "submissions_data"
+    }
+    for issue in submissions_data["submissions_data"]:
         if "submissions" in issue:
-            # add the data collection metadata
-            new_keys = [
-                f"issue_{_}" if _ not in ["issue", "submissions"] else _ for _ in issue
-            ]
-            issue = {k: v for k, v in zip(new_keys, issue.values())}
-            issue = {**issue, **submissions_data}
-            issue_specific_submissions = issue.pop("submissions")
-            for (
-                submission_entity_type,
-                submission_list,
-            ) in issue_specific_submissions.items():
+            # issue level columns, shared by all of its submissions
+            issue_flat = {
+                k if k == "issue" else f"issue_{k}": v
+                for k, v in issue.items()
+                if k != "submissions"
+            }
+            issue_flat.update(collection_metadata)
+            for submission_entity_type, submission_list in issue["submissions"].items():
+                entity_type = {"entity_type": submission_entity_type}
                 for submission_metadata in submission_list:
-                    submission_metadata["entity_type"] = submission_entity_type
-                    container.append({**submission_metadata, **issue})
-    df = pd.DataFrame(container)
-    df.to_csv(os.path.join(data_dir, "submissions_data.csv"))
+                    yield ChainMap(submission_metadata, entity_type, issue_flat)
+
+
+def write_to_csv(submissions_data: dict, data_dir: str = "data") -> None:
+    """write to data dir as csv"""
+    rows = flatten_submissions(submissions_data)
+    first_row = next(rows, None)
+    # all rows share the same columns: submission, entity type, then issue and collection metadata
+    fieldnames = [k for m in first_row.maps for k in m] if first_row else []
+    with open(os.path.join(data_dir, "submissions_data.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        if first_row is not None:
+            writer.writerow(first_row)
+            writer.writerows(rows)
+
+
+def geckodriver_is_missing(path_to_geckodriver: Optional[str]) -> bool:
+    """
+    Check that geckodriver was downloaded. None is left for selenium to resolve, and on windows an
+    extension-less path is resolved to the .exe that scripts/geckodriver.py extracts
+    """
+    if path_to_geckodriver is None:
+        return False
+    if sys.platform.startswith("win") and not os.path.splitext(path_to_geckodriver)[1]:
+        path_to_geckodriver += ".exe"
+    return not os.path.isfile(path_to_geckodriver)
 
 
 def main(**kwargs) -> None:
-    driver = deploy_firefox(**kwargs)
-    visit_main_page(driver)
-    submissions_data = parse_submissions(driver)
+    # bail before launching any browser
+    if geckodriver_is_missing(kwargs.get("path_to_geckodriver", GECKODRIVER_PATH)):
+        raise FileNotFoundError(
+            "geckodriver is missing, download it with: python3 scripts/geckodriver.py"
+        )
+    with BrowserPool(N_PANELS, **kwargs) as pool:
+        submissions_data = parse_submissions(pool)
     if not os.path.isdir("data"):
         os.mkdir("data")
     write_to_json(submissions_data, data_dir="data")
     write_to_csv(submissions_data, data_dir="data")
-    kill_webdriver(driver)
 
 
 if __name__ == "__main__":
@@ -1,49 +1,65 @@
 from platform import platform
 import requests
+import io
 import os
 import sys
 import tarfile
+import zipfile
 
 # paths
 PATH_TO_GECKODRIVER = "resources"
-URL_GECKODRIVER_LINUX = "https://github.com/mozilla/geckodriver/releases/download/v0.31.0/geckodriver-v0.31.0-linux64.tar.gz"
-URL_GECKODRIVER_MAC = "https://github.com/mozilla/geckodriver/releases/download/v0.31.0/geckodriver-v0.31.0-macos-aarch64.tar.gz"
-URL_GECKODRIVER_WIN = "https://github.com/mozilla/geckodriver/releases/download/v0.31.0/geckodriver-v0.31.0-win64.zip"
+# records the url of the downloaded build, i.e. its version and platform
+PATH_TO_VERSION = os.path.join(PATH_TO_GECKODRIVER, ".version")
+GECKODRIVER_VERSION = "v0.31.0"
+URL_GECKODRIVER_LINUX = f"https://github.com/mozilla/geckodriver/releases/download/{GECKODRIVER_VERSION}/geckodriver-{GECKODRIVER_VERSION}-linux64.tar.gz"
+URL_GECKODRIVER_MAC = f"https://github.com/mozilla/geckodriver/releases/download/{GECKODRIVER_VERSION}/geckodriver-{GECKODRIVER_VERSION}-macos-aarch64.tar.gz"
+URL_GECKODRIVER_WIN = f"https://github.com/mozilla/geckodriver/releases/download/{GECKODRIVER_VERSION}/geckodriver-{GECKODRIVER_VERSION}-win64.zip"
+
+# geckodriver build for this platform, None if unsupported
+if sys.platform.startswith("linux"):
+    URL_GECKODRIVER = URL_GECKODRIVER_LINUX
+elif sys.platform.startswith("darwin"):
+    URL_GECKODRIVER = URL_GECKODRIVER_MAC
+elif sys.platform.startswith("win"):
+    URL_GECKODRIVER = URL_GECKODRIVER_WIN
+else:
+    URL_GECKODRIVER = None
 
 if not os.path.isdir(PATH_TO_GECKODRIVER):
     os.mkdir(PATH_TO_GECKODRIVER)
 
 def download_geckodriver() -> None:
-    """download geckodriver to the resources folder"""
-    if sys.platform.startswith("linux"):
-        url = URL_GECKODRIVER_LINUX
-    elif sys.platform.startswith("darwin"):
-        url = URL_GECKODRIVER_MAC
-    elif sys.platform.contains("win"):
-        url = URL_GECKODRIVER_WIN
-    else:
+    """download and extract geckodriver to the resources folder"""
+    if URL_GECKODRIVER is None:
         raise TypeError("Can only download geckodriver for linux, macos, or windows")
-    resp = requests.get(url)
-    with open(os.path.join(PATH_TO_GECKODRIVER, "geckodriver.tar.gz"), "wb") as gf:
-        gf.write(resp.content)
+    with requests.get(URL_GECKODRIVER, stream=True) as resp:
+        resp.raise_for_status()
+        if URL_GECKODRIVER.endswith(".zip"):
+            # zip archives need a seekable file
+            with zipfile.ZipFile(io.BytesIO(resp.content)) as my_zipfile:
+                my_zipfile.extractall(PATH_TO_GECKODRIVER)
+        else:
+            # stream the tarball straight into the extraction, no intermediate file
+            with tarfile.open(fileobj=resp.raw, mode="r|gz") as my_tarfile:
+                my_tarfile.extractall(PATH_TO_GECKODRIVER)
+    with open(PATH_TO_VERSION, "w") as f:
+        f.write(URL_GECKODRIVER)
+
+
+def installed_version() -> str or None:
+    """url of the geckodriver build last downloaded to the resources folder"""
+    try:
+        with open(PATH_TO_VERSION) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
 
 
 def main() -> None:
-    geckodriver_path = os.path.join(PATH_TO_GECKODRIVER, "geckodriver.tar.gz")
-    needs_geckodriver = False
-    resources = [_.name for _ in os.scandir("resources")]
-    if not resources:
-        needs_geckodriver = True
-    else:
-        for _ in resources:
-            if "geckodriver" not in _:
-                needs_geckodriver = True
-    if needs_geckodriver:
+    resources = [_.name for _ in os.scandir(PATH_TO_GECKODRIVER)]
+    needs_geckodriver = not any("geckodriver" in _ for _ in resources)
+    if needs_geckodriver or installed_version() != URL_GECKODRIVER:
         download_geckodriver()
-        with tarfile.open(geckodriver_path) as my_tarfile:
-            my_tarfile.extractall("resources")
-            my_tarfile.close
-        os.remove(geckodriver_path)
 
 
 if __name__ == "__main__":